@@ -9,7 +9,7 @@ from typing import (
 )
 from os import get_terminal_size
 from dataclasses import dataclass
-import re
+from functools import lru_cache
 from textwrap import wrap
 from pathlib import Path
 from typing import IO
@@ -53,19 +53,23 @@ def get_term_width(max_term_width: int = MAX_REASONABLE_WIDTH):
 # FormatSpec
 ###############################################################################
 
-_FORMAT_SPEC_PATTERN = re.compile(
-    r"((?P<prefix_align>[<>])?(?P<prefix>[^<>]+)?\()?"
-    r"((?P<fill>.)?(?P<align>[<>=^]))?"
-    r"(?P<sign>[+\- ])?"
-    r"(?P<alternate>[z#])?"
-    r"(?P<zero>0)?"
-    r"(?P<width>\d+)?"
-    r"(?P<grouping_option>[_,])?"
-    r"(?P<precision>\.\d+)?"
-    r"(?P<type>[bcdeEfFgGnosxX%])?"
-    r"(?P<table_config>[ATS]+)?"
-    r"(\)(?P<suffix_align>[<>])?(?P<suffix>.+)?)?"
-)
+# Column spec grammar, scanned left to right by _parse_col_def_fields:
+#
+#   [prefix_align][prefix](            prefix_align: < >   prefix: no < or >
+#   [[fill]align][sign][alternate]     align: < > = ^   sign: + - space
+#   [0][width][grouping][.precision]   alternate: z #   grouping: _ ,
+#   [type][table_config]               type: bcdeEfFgGnosxX%   config: A T S
+#   )[suffix_align][suffix]            suffix_align: < >
+#
+# Every part is optional and anything left over after the last part that
+# matched is ignored.
+_PREFIX_ALIGN_CHARS = "<>"
+_ALIGN_CHARS = "<>=^"
+_SIGN_CHARS = "+- "
+_ALTERNATE_CHARS = "z#"
+_GROUPING_CHARS = "_,"
+_TYPE_CHARS = "bcdeEfFgGnosxX%"
+_TABLE_CONFIG_CHARS = "ATS"
 
 
 @dataclass
@@ -79,21 +83,49 @@ class FormatSpec:
     grouping: str = ""
     precision: str = ""
     type: str = ""
+    # the spec string is read for every formatted cell, so it is built once
+    # and cached until any field changes. Left unannotated so the cache stays
+    # out of fields(), asdict() and astuple().
+    _text = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_text":
+            object.__setattr__(self, "_text", None)
 
     def __str__(self) -> str:
-        return (
-            f"{self.fill}{self.align}{self.sign}{self.alternate}"
-            f"{self.zero}{self.width if self.width > 0 else ''}{self.grouping}"
-            f"{self.precision}{self.type}"
-        )
+        if self._text is None:
+            self._text = (
+                f"{self.fill}{self.align}{self.sign}{self.alternate}"
+                f"{self.zero}{self.width if self.width > 0 else ''}{self.grouping}"
+                f"{self.precision}{self.type}"
+            )
+        return self._text
+
+    @classmethod
+    def _from_state(cls, state: dict[str, Any]) -> "FormatSpec":
+        """
+        Build a FormatSpec from a snapshot of another instance's __dict__.
+
+        Used by ColDef.parse to clone memoized specs; __init__ routes every
+        field through __setattr__, which is several times slower. This skips
+        __init__ entirely, so it relies on FormatSpec keeping an instance
+        __dict__ (no slots) and having no __post_init__.
+        """
+        format_spec = cls.__new__(cls)
+        format_spec.__dict__.update(state)
+        return format_spec
 
 
 ###############################################################################
 # ColDef
 ###############################################################################
 
+# exact types whose format(value, "") is identical to str(value)
+_PLAIN_VALUE_TYPES = frozenset((str, int, float))
 
-@dataclass
+
+@dataclass(slots=True)
 class ColDef:
     width: int = 0
     align: str = "<"
@@ -118,16 +150,30 @@ class ColDef:
                     self.format_spec.width = adj_width
 
     def format(self, value: Any) -> str:
-        # "Inner" format
-        if self.format_spec:
-            format_string = f"{{:{self.format_spec}}}"
-        else:
-            format_string = "{}"
+        # Fast path for the most common columns: plain width/alignment specs
+        # ("10", "<15", ">10") holding builtin values need only the outer pad
+        if (
+            self.format_spec is None
+            and not self.prefix
+            and not self.suffix
+            and type(value) in _PLAIN_VALUE_TYPES
+        ):
+            return self.format_text(str(value))
+
+        # "Inner" format; the builtin format() skips the str.format template
+        # parse that a "{:spec}" string would need on every cell
+        format_spec = str(self.format_spec) if self.format_spec else ""
 
         # convert None to user-configurable text
         val = value if value is not None else self.none_text
         try:
-            text = format_string.format(val)
+            # with no inner spec, the common builtins format exactly as str()
+            # does, so skip the __format__ dispatch for them; padding to the
+            # column width happens once, in format_text
+            if not format_spec and type(val) in _PLAIN_VALUE_TYPES:
+                text = str(val)
+            else:
+                text = format(val, format_spec)
         except:  # noqa: E722
             # On failure, fall back to string unless strict mode
             if self.strict:
@@ -135,7 +181,7 @@ class ColDef:
             else:
                 text = str(val)
         # add prefix and suffix if there is a value
-        if value is not None:
+        if value is not None and (self.prefix or self.suffix):
             text = f"{self.prefix}{text}{self.suffix}"
 
         # "Outer" format
@@ -173,6 +219,10 @@ class ColDef:
         return text
 
     def format_text(self, text: str) -> str:
+        # tabs would otherwise count as a single column; expand them the same
+        # way textwrap does for wrapped cells
+        if "\t" in text:
+            text = text.expandtabs()
         if len(text) > self.width and self.truncate:
             text = text[: self.width - 1] + "…"
 
@@ -187,74 +237,177 @@ class ColDef:
 
     @staticmethod
     def parse(text) -> "ColDef":
-        match = _FORMAT_SPEC_PATTERN.match(text)
-        if not match:
-            raise InvalidColDefError(f"Invalid format specifier for column: {text}")
-        spec = match.groupdict()
-        prefix = spec["prefix"] if spec["prefix"] else ""
-        prefix_align = spec["prefix_align"] if spec["prefix_align"] else ""
-        fill = spec["fill"] if spec["fill"] else ""
-        align = spec["align"]
-        if not align or align == "=":
-            align = ""
-            fill = ""
-        sign = spec["sign"] if spec["sign"] else ""
-        alternate = spec["alternate"] if spec["alternate"] else ""
-        zero = spec["zero"] if spec["zero"] else ""
-        width = int(spec["width"]) if spec["width"] else 0
-        grouping = spec["grouping_option"] if spec["grouping_option"] else ""
-        precision = spec["precision"] if spec["precision"] else ""
-        type_ = spec["type"] if spec["type"] else ""
-        suffix_align = spec["suffix_align"] if spec["suffix_align"] else ""
-        suffix = spec["suffix"] if spec["suffix"] else ""
-
-        auto_size = False
-        truncate = False
-
-        table_config = spec["table_config"]
-        if table_config:
-            if "A" in table_config:
-                auto_size = True
-            if "T" in table_config:
-                truncate = True
-
-        format_spec = FormatSpec(
-            fill=fill,
-            align=align,
-            sign=sign,
-            alternate=alternate,
-            zero=zero,
-            grouping=grouping,
-            precision=precision,
-            type=type_,
-        )
+        # Parsing is memoized on the spec string; every call still builds a
+        # fresh ColDef (and FormatSpec) because both are mutated later on
+        # (set_width, auto_fill, none_text, processors, ...).
+        col_def_fields, format_spec_state = _parse_col_def_fields(text)
+        format_spec = None
+        if format_spec_state is not None:
+            # restoring the cached state also keeps the rendered spec text
+            format_spec = FormatSpec._from_state(format_spec_state)
+        return ColDef(format_spec=format_spec, **col_def_fields)
 
-        if width and (prefix_align == "<" or suffix_align == ">"):
-            adj_width = width - len(prefix) - len(suffix)
-            if adj_width > 0:
-                format_spec.width = adj_width
-        else:
-            format_spec.align = ""
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Drop the memoized spec strings behind ColDef.parse."""
+        _parse_col_def_fields.cache_clear()
 
-        # if format spec is just a number, then just toss it to avoid
-        # inadvertent right-aligned numbers.
-        try:
-            _ = int(str(format_spec))
-            format_spec = None
-        except ValueError:
-            pass
-
-        return ColDef(
-            prefix=prefix,
-            prefix_align=prefix_align,
-            suffix=suffix,
-            suffix_align=suffix_align,
-            width=width,
-            align=align,
-            auto_fill=auto_size,
-            truncate=truncate,
-            format_spec=format_spec,
-        )
+
+@lru_cache(maxsize=512)
+def _parse_col_def_fields(
+    text: str,
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """
+    Parse a column spec string into ColDef constructor kwargs and FormatSpec
+    instance state.
+
+    The returned dicts are shared by every caller through the cache and must
+    be treated as read-only; ColDef.parse only ever copies from them.
+
+    Returns:
+        (col_def_fields, format_spec_state); format_spec_state is None when
+        the spec carries no inner format.
+    """
+    n = len(text)
+    pos = 0
+
+    # prefix: everything up to the last "(" that precedes any other < or >
+    prefix_align = ""
+    prefix = ""
+    start = 1 if n and text[0] in _PREFIX_ALIGN_CHARS else 0
+    stop = start
+    while stop < n and text[stop] not in _PREFIX_ALIGN_CHARS:
+        stop += 1
+    paren = text.rfind("(", start, stop)
+    if paren >= 0:
+        prefix_align = text[:start]
+        prefix = text[start:paren]
+        pos = paren + 1
+
+    # standard format spec
+    fill = ""
+    align = ""
+    if pos + 1 < n and text[pos + 1] in _ALIGN_CHARS and text[pos] != "\n":
+        fill = text[pos]
+        align = text[pos + 1]
+        pos += 2
+    elif pos < n and text[pos] in _ALIGN_CHARS:
+        align = text[pos]
+        pos += 1
+    if align == "=":
+        align = ""
+    if not align:
+        fill = ""
+
+    sign = ""
+    if pos < n and text[pos] in _SIGN_CHARS:
+        sign = text[pos]
+        pos += 1
+
+    alternate = ""
+    if pos < n and text[pos] in _ALTERNATE_CHARS:
+        alternate = text[pos]
+        pos += 1
+
+    zero = ""
+    if pos < n and text[pos] == "0":
+        zero = "0"
+        pos += 1
+
+    digits = pos
+    while pos < n and text[pos].isdecimal():
+        pos += 1
+    width = int(text[digits:pos]) if pos > digits else 0
+
+    grouping = ""
+    if pos < n and text[pos] in _GROUPING_CHARS:
+        grouping = text[pos]
+        pos += 1
+
+    precision = ""
+    if pos + 1 < n and text[pos] == "." and text[pos + 1].isdecimal():
+        digits = pos
+        pos += 2
+        while pos < n and text[pos].isdecimal():
+            pos += 1
+        precision = text[digits:pos]
+
+    type_ = ""
+    if pos < n and text[pos] in _TYPE_CHARS:
+        type_ = text[pos]
+        pos += 1
+
+    # table config flags
+    config = pos
+    while pos < n and text[pos] in _TABLE_CONFIG_CHARS:
+        pos += 1
+    table_config = text[config:pos]
+
+    # suffix: only after a closing ")", and never past a newline
+    suffix_align = ""
+    suffix = ""
+    if pos < n and text[pos] == ")":
+        pos += 1
+        if pos < n and text[pos] in _PREFIX_ALIGN_CHARS:
+            suffix_align = text[pos]
+            pos += 1
+        suffix = text[pos:].partition("\n")[0]
+
+    auto_size = False
+    truncate = False
+
+    if table_config:
+        if "A" in table_config:
+            auto_size = True
+        if "T" in table_config:
+            truncate = True
+
+    format_spec = FormatSpec(
+        fill=fill,
+        align=align,
+        sign=sign,
+        alternate=alternate,
+        zero=zero,
+        grouping=grouping,
+        precision=precision,
+        type=type_,
+    )
+
+    if width and (prefix_align == "<" or suffix_align == ">"):
+        adj_width = width - len(prefix) - len(suffix)
+        if adj_width > 0:
+            format_spec.width = adj_width
+    else:
+        format_spec.align = ""
+
+    # if format spec is just a number, then just toss it to avoid
+    # inadvertent right-aligned numbers. str() runs first so the state
+    # handed to ColDef.parse carries the rendered spec text as well.
+    format_spec_text = str(format_spec)
+    format_spec_state: dict[str, Any] | None = dict(vars(format_spec))
+    try:
+        _ = int(format_spec_text)
+        format_spec_state = None
+    except ValueError:
+        pass
+
+    # likewise toss an empty spec (plain padding like "<10" or "^20"), so
+    # cells skip the inner format entirely. Keep it when an aligned prefix
+    # or suffix means set_width may still give it a width later.
+    if not format_spec_text and prefix_align != "<" and suffix_align != ">":
+        format_spec_state = None
+
+    col_def_fields = dict(
+        prefix=prefix,
+        prefix_align=prefix_align,
+        suffix=suffix,
+        suffix_align=suffix_align,
+        width=width,
+        align=align,
+        auto_fill=auto_size,
+        truncate=truncate,
+    )
+    return col_def_fields, format_spec_state
 
 
 ###############################################################################
@@ -282,10 +435,10 @@ class ColDefList(list[ColDef]):
 
     def __setitem__(self, key, value):
         if isinstance(key, SupportsIndex):
-            if isinstance(value, str):
-                super().__setitem__(key, ColDef.parse(value))
-            elif isinstance(value, ColDef):
+            if isinstance(value, ColDef):
                 super().__setitem__(key, value)
+            elif isinstance(value, str):
+                super().__setitem__(key, ColDef.parse(value))
             else:
                 raise ValueError("Column definition contain an invalid value")
         elif isinstance(key, slice) and isinstance(value, Iterable):
@@ -311,10 +464,12 @@ class ColDefList(list[ColDef]):
         return super().__iter__()
 
     def append(self, object):
-        if isinstance(object, str):
-            super().append(ColDef.parse(object))
-        elif isinstance(object, ColDef):
+        # ColDef first: internal callers (adjust_to_table, header defs, slices)
+        # append ready-made ColDefs far more often than spec strings
+        if isinstance(object, ColDef):
             super().append(object)
+        elif isinstance(object, str):
+            super().append(ColDef.parse(object))
         else:
             raise ValueError("Column definitions contain an invalid value")
 
@@ -356,33 +511,53 @@ class ColDefList(list[ColDef]):
         style: TableStyle,
         has_header: bool = False,
         clear_cache: bool = False,
+        measured: dict[int, tuple[str, list[str]]] | None = None,
     ) -> None:
+        """
+        Size every column to the table's content and the requested width.
+
+        Args:
+            measured: (optional) Filled with the formatted text of each
+                auto-sized value cell, keyed by column index, alongside the
+                column's inner format spec at measurement time. Lets a caller
+                render those cells without formatting them a second time.
+        """
         # Skip if already adjusted
         if self._adjusted and not clear_cache:
             return
         self._adjusted = True
 
         # ADD MISSING COL DEFS
-        max_cols = max([len(row) for row in table_data])
+        max_cols = max(map(len, table_data))
         diff = max_cols - len(self)
         if diff:
             for _ in range(diff):
                 self.append(ColDef())
 
         # ADJUST WIDTHS OF FIELDS TO MATCH REALITY
+        value_rows = table_data[1:] if has_header else table_data
         for col_idx in range(max_cols):
             col_def = self[col_idx]
             if not col_def.width:
-                max_width = 0
-                is_header = has_header
-                for row in table_data:
-                    if is_header:
-                        is_header = False
-                        cell = str(row[col_idx])
-                    else:
-                        value = col_def.preprocess(row[col_idx], row, col_idx)
-                        cell = col_def.format(value)
-                    max_width = max(max_width, len(cell))
+                # one column at a time, with the per-cell work inlined into a
+                # comprehension and the max taken by the builtin
+                format_cell = col_def.format
+                if col_def.preprocessor is None:
+                    cells = [format_cell(row[col_idx]) for row in value_rows]
+                else:
+                    preprocess = col_def.preprocess
+                    cells = [
+                        format_cell(preprocess(row[col_idx], row, col_idx))
+                        for row in value_rows
+                    ]
+                max_width = max(map(len, cells), default=0)
+                # truncation at width 0 mangles the text, so only plain
+                # measurements are worth keeping
+                if measured is not None and not col_def.truncate:
+                    measured[col_idx] = (str(col_def.format_spec), cells)
+                if has_header:
+                    header_text = str(table_data[0][col_idx]).expandtabs()
+                    max_width = max(max_width, len(header_text))
 
                 col_def.set_width(max_width)
 
@@ -443,7 +618,7 @@ class ColDefList(list[ColDef]):
     @staticmethod
     def for_table(table: list[list[Any]]) -> "ColDefList":
         ColDefList.assert_valid_table(table)
-        max_cols = max([len(row) for row in table])
+        max_cols = max(map(len, table))
         col_defs = ColDefList([ColDef() for _ in range(max_cols)])
         return col_defs
 
@@ -461,14 +636,21 @@ def _get_adjusted_col_defs(
     preprocessors: PreprocessorCallbackList | None = None,
     postprocessors: PostprocessorCallbackList | None = None,
     none_text: str = "",
+    has_header: bool = True,
+    measured: dict[int, tuple[str, list[str]]] | None = None,
 ) -> ColDefList:
-    # Normalize col_defs
-    if not col_defs:
-        _col_defs = ColDefList.for_table(all_rows)
-    elif isinstance(col_defs, ColDefList):
+    # Normalize col_defs, once per table; every caller hands in rows it has
+    # already built, so they need no re-validation via ColDefList.for_table
+    if col_defs and isinstance(col_defs, ColDefList):
         _col_defs = col_defs
     else:
-        _col_defs = ColDefList(col_defs)
+        _col_defs = ColDefList(col_defs or ())
+
+    # Cover every column up front (all of them when no col_defs were given),
+    # so the callbacks and none_text resolved below reach them too
+    missing = max(map(len, all_rows)) - len(_col_defs)
+    for _ in range(missing):
+        _col_defs.append(ColDef())
 
     # Attach callbacks before width adjustment so preprocessors influence sizing
     if preprocessors:
@@ -488,11 +670,47 @@ def _get_adjusted_col_defs(
             col_def.none_text = none_text
 
     # Adjust column definitions to match table data
-    _col_defs.adjust_to_table(all_rows, table_width, style, has_header=True)
+    _col_defs.adjust_to_table(
+        all_rows, table_width, style, has_header=has_header, measured=measured
+    )
 
     return _col_defs
 
 
+@lru_cache(maxsize=128)
+def _get_border(
+    line: str, left: str, delim: str, right: str, widths: tuple[int, ...]
+) -> str:
+    """
+    Build a horizontal border (top, bottom or row separator) line.
+
+    Only plain strings and ints go in, so the result is safe to cache; tables
+    of the same shape and style reuse their borders across renders.
+
+    Args:
+        widths: Full width of each column, including cell padding.
+    """
+    return left + delim.join([line * width for width in widths]) + right
+
+
+def _pad_rows(rows: list[list[Any]]) -> int:
+    """
+    Pad every row in place with empty strings to the widest row's length.
+
+    Jagged input is legal; padding up front lets width calculation and
+    rendering index every column of every row safely.
+
+    Returns:
+        The resulting column count.
+    """
+    max_cols = max(map(len, rows))
+    for row in rows:
+        if len(row) < max_cols:
+            row.extend([""] * (max_cols - len(row)))
+
+    return max_cols
+
+
 def _generate_header_defs(
     header_row: Iterable[Any] | None,
     header_defs: Iterable[str] | Iterable[ColDef] | ColDefList | None,
@@ -523,6 +741,27 @@ def _generate_header_defs(
 ###############################################################################
 
 
+def _get_row_frame(
+    style: TableStyle, lazy_end: bool = False, is_header: bool = False
+) -> tuple[str, str, str]:
+    """
+    Build the (left, delimiter, right) strings that frame a row's cells.
+
+    They depend only on the style, so get_table builds them once per table
+    rather than once per row.
+    """
+    padding = " " * style.cell_padding
+    if is_header:
+        delim = padding + str(style.header_delimiter) + padding
+        left = str(style.header_left) + padding
+        right = "" if lazy_end else padding + str(style.header_right)
+    else:
+        delim = padding + str(style.values_delimiter) + padding
+        left = str(style.values_left) + padding
+        right = "" if lazy_end else padding + str(style.values_right)
+    return left, delim, right
+
+
 def _get_table_row(
     values: list[Any],
     col_defs: ColDefList,
@@ -530,10 +769,9 @@ def _get_table_row(
     table_width: int = 0,
     lazy_end: bool = False,
     is_header: bool = False,
+    frame: tuple[str, str, str] | None = None,
+    formatted: list[str | None] | None = None,
 ) -> str:
-    if not table_width and style.terminal_style:
-        table_width = get_term_width()
-
     # Cache _col_defs to a native list. Even though ColDefList is a subclass of
     # list, it has method call overhead on each access. Using the "bare" list is
     # slightly faster, which adds up for large tables.
@@ -542,18 +780,50 @@ def _get_table_row(
     col_count = len(values)
 
     formatted_values = []
+    # lines of multi-line cells, split once here and reused by the slow path
+    split_cells: dict[int, list[str]] = {}
+    fits_one_line = True
     for col_idx in range(col_count):
         col_def = _cached_col_defs[col_idx]
-        col_val = col_def.preprocess(values[col_idx], values, col_idx)
-        text = col_def.format(col_val)
+        # cells the caller already formatted (see get_table) are used as is
+        text = formatted[col_idx] if formatted else None
+        if text is None:
+            col_val = values[col_idx]
+            if col_def.preprocessor is not None:
+                col_val = col_def.preprocess(col_val, values, col_idx)
+            text = col_def.format(col_val)
         formatted_values.append(text)
+        if fits_one_line:
+            if len(text) > col_def.width:
+                fits_one_line = False
+            # line breaks are never printable, so only those cells need a split
+            elif not text.isprintable():
+                split_cells[col_idx] = lines = text.splitlines()
+                if len(lines) > 1:
+                    fits_one_line = False
+
+    left, delim, right = frame or _get_row_frame(style, lazy_end, is_header)
+
+    # Fast path for the common case: every cell is one line that already fits,
+    # so there is nothing to split, wrap or re-pad
+    if fits_one_line:
+        row_cells = formatted_values
+        if any(col_def.postprocessor is not None for col_def in _cached_col_defs):
+            row_cells = [
+                _cached_col_defs[col_idx].postprocess(
+                    values[col_idx], formatted_values[col_idx], values, col_idx
+                )
+                for col_idx in range(col_count)
+            ]
+        row_text = left + delim.join(row_cells) + right
+        return row_text.rstrip() if lazy_end else row_text
 
     all_col_lines = []
     for col_idx in range(col_count):
         col_lines = []
         col_def = _cached_col_defs[col_idx]
         text = formatted_values[col_idx]
-        split = text.splitlines()
+        split = split_cells.get(col_idx) or text.splitlines()
         if not split:
             split = [""]
         for line in split:
@@ -573,7 +843,7 @@ def _get_table_row(
         # Append the collected lines for this column once
         all_col_lines.append(col_lines)
 
-    max_rows = max([len(col) for col in all_col_lines])
+    max_rows = max(map(len, all_col_lines))
 
     if max_rows == 1:
         # Single line per column; build a single row of cells
@@ -599,16 +869,6 @@ def _get_table_row(
                 row.append(text)
             wrapped_rows.append(row)
 
-    padding = " " * style.cell_padding
-    if is_header:
-        delim = padding + str(style.header_delimiter) + padding
-        left = str(style.header_left) + padding
-        right = "" if lazy_end else padding + str(style.header_right)
-    else:
-        delim = padding + str(style.values_delimiter) + padding
-        left = str(style.values_left) + padding
-        right = "" if lazy_end else padding + str(style.values_right)
-
     final_rows = []
     for row in wrapped_rows:
         row_text = left + delim.join(row) + right
@@ -680,6 +940,7 @@ def get_table_row(
         preprocessors=preprocessors,
         postprocessors=postprocessors,
         none_text=none_text,
+        has_header=False,
     )
     return _get_table_row(
         values=values,
@@ -767,10 +1028,8 @@ def get_table_header(
         delim = str(style.header_top_delimiter)
         left = str(style.header_top_left)
         right = line if lazy_end else str(style.header_top_right)
-        border_lines = [line * (col.width + padding_width) for col in _col_defs]
-        border = delim.join(border_lines)
-        border = left + border + right
-        lines.append(border)
+        widths = tuple([col.width + padding_width for col in _col_defs])
+        lines.append(_get_border(line, left, delim, right, widths))
 
     headers = _get_table_row(
         values=header_cols,
@@ -786,26 +1045,28 @@ def get_table_header(
     delim = str(style.header_bottom_delimiter)
     left = str(style.header_bottom_left)
     right = line if lazy_end else str(style.header_bottom_right)
+    header_defs_list = _header_defs.as_list()[: len(header_cols)]
+    if not style.align_char:
+        widths = tuple([hd.width + padding_width for hd in header_defs_list])
+        lines.append(_get_border(line, left, delim, right, widths))
+        return "\n".join(lines)
+
+    # alignment markers (e.g. Markdown's ":---:") make this line per column
+    align_char = str(style.align_char)
     border_lines = []
-    for col_idx in range(len(header_cols)):
-        header_def = _header_defs[col_idx]
-        if not style.align_char:
-            h_line = line * (header_def.width + padding_width)
+    for col_idx, header_def in enumerate(header_defs_list):
+        col_def = None
+        if col_idx < len(_col_defs):
+            col_def = _col_defs[col_idx]
+        h_line = line * header_def.width
+        if col_def and col_def.align == "^":
+            h_line = align_char + h_line + align_char
+        elif col_def and col_def.align == ">":
+            h_line = " " + h_line + align_char
         else:
-            col_def = None
-            if col_idx < len(_col_defs):
-                col_def = _col_defs[col_idx]
-            h_line = line * header_def.width
-            if col_def and col_def.align == "^":
-                h_line = str(style.align_char) + h_line + str(style.align_char)
-            elif col_def and col_def.align == ">":
-                h_line = " " + h_line + str(style.align_char)
-            else:
-                h_line = " " + h_line + " "
+            h_line = " " + h_line + " "
         border_lines.append(h_line)
-    border = delim.join(border_lines)
-    border = left + border + right
-    lines.append(border)
+    lines.append(left + delim.join(border_lines) + right)
 
     return "\n".join(lines)
 
@@ -899,7 +1160,13 @@ def get_table(
             "Use export_table() instead."
         )
 
-    if not value_rows:
+    # convert / copy the rows to a list of lists. Slight overhead but it helps
+    # with consistency and prevents accidentally modifying the caller's data.
+    # This is the only pass over value_rows, so one-shot iterables (generators,
+    # map, zip, ...) work, and an exhausted or empty one is caught below.
+    _value_rows: list[list[Any]] = [list(row) for row in value_rows or ()]
+
+    if not _value_rows:
         return get_table(
             [["No data to display"]],
             style=style,
@@ -912,9 +1179,6 @@ def get_table(
 
     padding_width = 2 * style.cell_padding
 
-    # convert / copy the rows to a list of lists. Slight overhead but it helps
-    # with consistency and prevents accidentally modifying the caller's data.
-    _value_rows: list[list[Any]] = [list(row) for row in value_rows]
     _header_row: list[Any] | None = None
     if header_row:
         _header_row = [str(col) for col in header_row]
@@ -924,8 +1188,11 @@ def get_table(
     if _header_row:
         all_rows.insert(0, _header_row)
 
-    max_cols = max(len(row) for row in all_rows)
+    # pad jagged rows (and the header) before any widths are measured
+    max_cols = _pad_rows(all_rows)
 
+    # formatted text of the auto-sized columns, captured while measuring them
+    measured: dict[int, tuple[str, list[str]]] = {}
     _col_defs = _get_adjusted_col_defs(
         all_rows=all_rows,
         style=style,
@@ -934,6 +1201,8 @@ def get_table(
         preprocessors=preprocessors,
         postprocessors=postprocessors,
         none_text=none_text,
+        has_header=bool(_header_row),
+        measured=measured,
     )
 
     if not header_row and style.force_header:
@@ -950,13 +1219,12 @@ def get_table(
     if callable(renderer):
         return str(renderer(_value_rows, _header_row, _col_defs, _header_defs))
 
+    # full width of every column, shared by all the horizontal borders
+    border_widths = tuple([col.width + padding_width for col in _col_defs])
+
     # Generate header and rows
     output_rows = []
     if _header_row:
-        if len(_header_row) < max_cols:
-            # pad header row
-            diff = max_cols - len(_header_row)
-            _header_row.extend([""] * diff)
         row = get_table_header(
             header_cols=_header_row,
             style=style,
@@ -972,50 +1240,55 @@ def get_table(
             delim = str(style.no_header_top_delimiter)
             left = str(style.no_header_top_left)
             right = line if lazy_end else str(style.no_header_top_right)
-            border_lines = [line * (col.width + padding_width) for col in _col_defs]
-            border = delim.join(border_lines)
-            border = left + border + right
-            output_rows.append(border)
+            output_rows.append(_get_border(line, left, delim, right, border_widths))
+
+    # Optional separator between value rows; it is the same line every time,
+    # so build it once rather than once per row
+    separator = None
+    if separate_rows and style.row_separator_line:
+        line = str(style.row_separator_line)
+        left = str(style.row_separator_left)
+        right = line if lazy_end else str(style.row_separator_right)
+        delim = str(style.row_separator_delimiter)
+        separator = _get_border(line, left, delim, right, border_widths)
+
+    # Measured text can stand in for a fresh format() unless sizing changed
+    # the column's inner spec since (set_width resizes aligned prefix specs);
+    # it then only needs padding to the final width
+    reusable = [
+        (col_idx, _col_defs[col_idx], cells)
+        for col_idx, (spec, cells) in measured.items()
+        if str(_col_defs[col_idx].format_spec) == spec
+    ]
 
     # Add Value Rows
-    rowcount = 0
-    for values in _value_rows:
-        rowcount += 1
-        lastrow = rowcount == len(_value_rows)
-        if len(values) < max_cols:
-            # pad row
-            diff = max_cols - len(values)
-            values.extend([""] * diff)
+    frame = _get_row_frame(style, lazy_end)
+    for row_idx, values in enumerate(_value_rows):
+        if row_idx and separator is not None:
+            output_rows.append(separator)
+        formatted: list[str | None] | None = None
+        if reusable:
+            formatted = [None] * max_cols
+            for col_idx, col_def, cells in reusable:
+                formatted[col_idx] = col_def.format_text(cells[row_idx])
         row = _get_table_row(
             values=values,
             style=style,
             col_defs=_col_defs,
             table_width=table_width,
             lazy_end=lazy_end,
+            frame=frame,
+            formatted=formatted,
         )
         output_rows.append(row)
 
-        # Optionally add Separators Between Rows
-        if not lastrow and separate_rows and style.row_separator_line:
-            line = str(style.row_separator_line)
-            left = str(style.row_separator_left)
-            right = line if lazy_end else str(style.row_separator_right)
-            delim = str(style.row_separator_delimiter)
-            sep_lines = [line * (col.width + padding_width) for col in _col_defs]
-            separator = delim.join(sep_lines)
-            separator = left + separator + right
-            output_rows.append(separator)
-
     # Add Bottom Border
     if style.bottom_border:
         line = str(style.values_bottom_line)
         delim = str(style.values_bottom_delimiter)
         left = str(style.values_bottom_left)
         right = line if lazy_end else str(style.values_bottom_right)
-        border_lines = [line * (col.width + padding_width) for col in _col_defs]
-        border = delim.join(border_lines)
-        border = left + border + right
-        output_rows.append(border)
+        output_rows.append(_get_border(line, left, delim, right, border_widths))
 
     return "\n".join(output_rows)
 
@@ -1090,15 +1363,23 @@ def export_table(
     """
 
     # Normalize inputs similar to get_table()
-    _value_rows: list[list[Any]] = [list(row) for row in value_rows]
+    _value_rows: list[list[Any]] = [list(row) for row in value_rows or ()]
     _header_row: list[Any] | None = None
     if header_row:
         _header_row = [str(col) for col in header_row]
 
+    # Nothing to size: export the same placeholder table get_table renders
+    if not _value_rows and not _header_row:
+        return export_table(
+            [["No data to display"]], style=style, file=file, encoding=encoding
+        )
+
     all_rows = _value_rows.copy()
     if _header_row:
         all_rows.insert(0, _header_row)
 
+    max_cols = _pad_rows(all_rows)
+
     _col_defs = _get_adjusted_col_defs(
         all_rows=all_rows,
         style=style,
@@ -1106,10 +1387,9 @@ def export_table(
         preprocessors=preprocessors,
         postprocessors=postprocessors,
         none_text=none_text,
+        has_header=bool(_header_row),
     )
 
-    max_cols = max(len(row) for row in all_rows)
-
     if not header_row and style.force_header:
         header_row = [""] * max_cols
 
@@ -1152,10 +1432,12 @@ def export_table(
                 file.write(str(content))  # type: ignore[arg-type]
                 return None
 
-    # Fallback to core text renderer
+    # Fallback to core text renderer. Hand over the rows already materialized
+    # above; value_rows (and header_row) may be one-shot iterables that are
+    # now exhausted.
     content = get_table(
-        value_rows,
-        header_row=header_row,
+        _value_rows,
+        header_row=_header_row if _header_row is not None else header_row,
         style=style,
         col_defs=_col_defs,
         header_defs=_header_defs,
@@ -47,47 +47,45 @@ class RtfStyle(TableStyle):
             x += col_twips
             cellx_positions.append(x)
 
+        def rtf_align(align: str) -> str:
+            if ">" in align:
+                return "\\qr"
+            if "^" in align:
+                return "\\qc"
+            return "\\ql"
+
+        # The row preamble (cell boundaries) and each column's alignment are
+        # the same for every row, so build them once up front. Headers use
+        # header_defs alignment where available.
+        row_start = "\\trowd\\trgaph108" + "".join(
+            [f"\\cellx{cx}" for cx in cellx_positions]
+        )
+        value_aligns = [rtf_align(cd.align) for cd in col_defs]
+        header_aligns = [
+            rtf_align(header_defs[idx].align)
+            if header_defs and idx < len(header_defs)
+            else value_aligns[idx]
+            for idx in range(len(value_aligns))
+        ]
+
         parts: list[str] = []
         parts.append("{\\rtf1\\ansi")
 
-        def row_to_rtf(
-            cells: list[str], bold: bool = False, use_header_defs: bool = False
-        ) -> None:
-            parts.append("\\trowd\\trgaph108")
-            # Define cell boundaries
-            for cx in cellx_positions:
-                parts.append(f"\\cellx{cx}")
+        def row_to_rtf(cells: list[str], aligns: list[str], bold: bool = False) -> None:
+            parts.append(row_start)
             # Cell contents
             for idx, text in enumerate(cells):
-                # Alignment mapping using paragraph alignment
-                # For headers, use header_defs alignment if available
-                if use_header_defs and header_defs and idx < len(header_defs):
-                    hdr_def = header_defs[idx]
-                    if ">" in hdr_def.align:
-                        align = "\\qr"
-                    elif "^" in hdr_def.align:
-                        align = "\\qc"
-                    else:
-                        align = "\\ql"
-                else:
-                    cd = col_defs[idx]
-                    if ">" in cd.align:
-                        align = "\\qr"
-                    elif "^" in cd.align:
-                        align = "\\qc"
-                    else:
-                        align = "\\ql"
                 content = self._escape(text)
                 # Wrap in \b ... \b0 for header bold
                 if bold:
-                    parts.append(f"{{\\intbl {align} \\b {content} \\b0 \\cell}}")
+                    parts.append(f"{{\\intbl {aligns[idx]} \\b {content} \\b0 \\cell}}")
                 else:
-                    parts.append(f"{{\\intbl {align} {content} \\cell}}")
+                    parts.append(f"{{\\intbl {aligns[idx]} {content} \\cell}}")
             parts.append("\\row")
 
         # Write header row
         if header_row:
-            row_to_rtf([str(h) for h in header_row], bold=True, use_header_defs=True)
+            row_to_rtf([str(h) for h in header_row], header_aligns, bold=True)
 
         # Helper for formatting with preprocess/postprocess
         def _format_for_export(cd, val, row: list[Any], col_idx: int) -> str:
@@ -110,7 +108,7 @@ class RtfStyle(TableStyle):
                 _format_for_export(cd, v, row, i)
                 for i, (v, cd) in enumerate(zip(row, col_defs))
             ]
-            row_to_rtf(formatted, bold=False)
+            row_to_rtf(formatted, value_aligns)
 
         parts.append("}")
         rtf_content = "".join(parts)
@@ -6,23 +6,24 @@ import unittest
 class TestFromDataframe(unittest.TestCase):
     """Test from_dataframe edge cases and error conditions."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Check if pandas/polars are available."""
         try:
             import pandas as pd
 
-            self.pd = pd
-            self.pandas_available = True
+            cls.pd = pd
+            cls.pandas_available = True
         except ImportError:
-            self.pandas_available = False
+            cls.pandas_available = False
 
         try:
             import polars as pl
 
-            self.pl = pl
-            self.polars_available = True
+            cls.pl = pl
+            cls.polars_available = True
         except ImportError:
-            self.polars_available = False
+            cls.polars_available = False
 
     def test_pandas_basic(self):
         """Test with pandas DataFrame."""
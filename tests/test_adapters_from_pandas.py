@@ -7,15 +7,16 @@ import unittest
 class TestFromNumpy(unittest.TestCase):
     """Tests for from_numpy adapter."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Check if numpy is available."""
         try:
             import numpy as np
 
-            self.np = np
-            self.numpy_available = True
+            cls.np = np
+            cls.numpy_available = True
         except ImportError:
-            self.numpy_available = False
+            cls.numpy_available = False
 
     def test_1d_array(self):
         """Test with 1D array."""
@@ -1,7 +1,31 @@
 """Unit tests for ColDef parsing, formatting, and alignment behavior."""
 
 import unittest
+from dataclasses import asdict, fields
+
 from craftable import ColDef
+from craftable.craftable import _parse_col_def_fields
+
+# (spec, width, align, auto_fill, truncate, str(format_spec))
+# padding-only specs carry no inner format spec at all
+PARSE_CASES = (
+    ("<15", 15, "<", False, False, "None"),
+    (">15", 15, ">", False, False, "None"),
+    ("^25", 25, "^", False, False, "None"),
+    ("10", 10, "", False, False, "None"),
+    ("<20AT", 20, "<", True, True, "None"),
+    ("10AT", 10, "", True, True, "None"),
+    ("<10T", 10, "<", False, True, "None"),
+    (".2f", 0, "", False, False, ".2f"),
+    (">8.2f", 8, ">", False, False, ".2f"),
+    ("*>10", 10, ">", False, False, "*"),
+    ("*=10", 10, "", False, False, "None"),
+    (">,d", 0, ">", False, False, ",d"),
+    (".1%", 0, "", False, False, ".1%"),
+    ("$(10)", 10, "", False, False, "None"),
+    ("<$(>12,.2f)>USD", 12, ">", False, False, ">8,.2f"),
+    ("", 0, "", False, False, "None"),
+)
 
 
 class TestColDef(unittest.TestCase):
@@ -14,27 +38,17 @@ class TestColDef(unittest.TestCase):
 
     def test_truncate(self):
         cd = ColDef(width=5, truncate=True)
-        self.assertIn("…", cd.format("LongValue"))
-
-    def test_parse_right_align(self):
-        cd = ColDef.parse(">15")
-        self.assertEqual(cd.width, 15)
-        self.assertEqual(cd.align, ">")
-
-    def test_parse_center_align(self):
-        cd = ColDef.parse("^25")
-        self.assertEqual(cd.width, 25)
-        self.assertEqual(cd.align, "^")
-
-    def test_parse_auto_and_truncate_flags(self):
-        cd = ColDef.parse("<20AT")
-        self.assertEqual(cd.width, 20)
-        self.assertTrue(cd.auto_fill)
-        self.assertTrue(cd.truncate)
+        self.assertEqual(cd.format("LongValue"), "Long…")
 
-    def test_parse_format_spec(self):
-        cd = ColDef.parse(".2f")
-        self.assertEqual(str(cd.format_spec), ".2f")
+    def test_parse_cases(self):
+        for spec, width, align, auto_fill, truncate, format_spec in PARSE_CASES:
+            with self.subTest(spec=spec):
+                cd = ColDef.parse(spec)
+                self.assertEqual(cd.width, width)
+                self.assertEqual(cd.align, align)
+                self.assertEqual(cd.auto_fill, auto_fill)
+                self.assertEqual(cd.truncate, truncate)
+                self.assertEqual(str(cd.format_spec), format_spec)
 
     def test_format_center_and_right(self):
         cd_center = ColDef(width=10, align="^")
@@ -48,3 +62,50 @@ class TestColDef(unittest.TestCase):
         self.assertEqual(cd.width, 20)
         if cd.format_spec:
             self.assertEqual(cd.format_spec.width, 16)
+
+    def test_parse_returns_independent_instances(self):
+        # parse results are memoized, but callers mutate what they get back
+        first = ColDef.parse("<$(>12,.2f)>USD")
+        first.set_width(30)
+        first.auto_fill = True
+        second = ColDef.parse("<$(>12,.2f)>USD")
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.format_spec, second.format_spec)
+        self.assertEqual(second.width, 12)
+        self.assertFalse(second.auto_fill)
+        self.assertEqual(str(second.format_spec), ">8,.2f")
+
+    def test_clear_parse_cache(self):
+        before = ColDef.parse("$(>10.2f)USD")
+        self.assertGreater(_parse_col_def_fields.cache_info().currsize, 0)
+        ColDef.clear_parse_cache()
+        self.assertEqual(_parse_col_def_fields.cache_info().currsize, 0)
+        self.assertEqual(ColDef.parse("$(>10.2f)USD"), before)
+
+    def test_parse_prefix_and_suffix_boundaries(self):
+        # prefix runs to the last "(" before the inner align; the suffix
+        # stops at a newline
+        cd = ColDef.parse("<a(b(>10)>x\ny")
+        self.assertEqual(
+            (cd.prefix_align, cd.prefix, cd.width, cd.suffix_align, cd.suffix),
+            ("<", "a(b", 10, ">", "x"),
+        )
+
+    def test_slots_reject_unknown_attributes(self):
+        cd = ColDef()
+        self.assertFalse(hasattr(cd, "__dict__"))
+        with self.assertRaises(AttributeError):
+            cd.widht = 10  # typo'd field names fail loudly
+
+    def test_format_spec_text_tracks_field_changes(self):
+        cd = ColDef.parse("<$(>12,.2f)>USD")
+        self.assertEqual(cd.format(1234.5), "$1,234.50USD")
+        cd.format_spec.width = 10
+        self.assertEqual(str(cd.format_spec), ">10,.2f")
+        self.assertEqual(cd.format(1234.5), "$  1,234.50USD")
+
+    def test_format_spec_text_cache_is_not_a_field(self):
+        spec = ColDef.parse(".2f").format_spec
+        str(spec)
+        self.assertNotIn("_text", [f.name for f in fields(spec)])
+        self.assertNotIn("_text", asdict(spec))
@@ -180,6 +180,22 @@ class TestExportTableEdgeCases(unittest.TestCase):
         content = stream.getvalue()
         self.assertIn("Alice", content)
 
+    def test_export_table_with_generators(self):
+        """Test that one-shot iterables survive the text fallback."""
+        rows = ((name, age) for name, age in [("Alice", 30), ("Bob", 25)])
+        header = (col for col in ["Name", "Age"])
+        result = export_table(rows, header_row=header, style=BasicScreenStyle())
+        self.assertNotIn("No data to display", result)
+        self.assertIn("Alice", result)
+        self.assertIn("Name", result)
+
+    def test_export_table_with_no_data(self):
+        """Test that empty input exports the placeholder table like get_table."""
+        for rows in ([], None, iter(())):
+            with self.subTest(rows=rows):
+                result = export_table(rows, style=BasicScreenStyle())
+                self.assertIn("No data to display", result)
+
     def test_export_table_markdown_requires_header(self):
         """Test that Markdown export creates empty header if none provided."""
         rows = [["Alice", 30], ["Bob", 25]]
@@ -368,11 +384,10 @@ class TestColDefParsing(unittest.TestCase):
     def test_parse_with_equals_align(self):
         """Test that = alignment resets fill and align."""
         col_def = ColDef.parse("*=10")
-        # = alignment should be converted to empty
+        # = alignment should be converted to empty, leaving a padding-only
+        # spec, which carries no inner format spec
         self.assertEqual(col_def.align, "")
-        self.assertIsNotNone(col_def.format_spec)
-        if col_def.format_spec:
-            self.assertEqual(col_def.format_spec.fill, "")
+        self.assertIsNone(col_def.format_spec)
 
     def test_parse_width_adjustment_with_prefix_suffix(self):
         """Test width adjustment for prefix/suffix alignment."""
@@ -13,31 +13,32 @@ from craftable.styles import DocxStyle, XlsxStyle, OdtStyle, OdsStyle, RtfStyle
 class TestExportHeaderAlignment(unittest.TestCase):
     """Test that header_defs properly controls header alignment in exports."""
 
-    ROWS = [["Alice", 30, 95000], ["Bob", 25, 75000]]
-    HEADERS = ["Name", "Age", "Salary"]
+    ROWS = (("Alice", 30, 95000), ("Bob", 25, 75000))
+    HEADERS = ("Name", "Age", "Salary")
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Check for optional dependencies."""
         try:
             import docx  # noqa: F401
 
-            self.docx_available = True
+            cls.docx_available = True
         except ImportError:
-            self.docx_available = False
+            cls.docx_available = False
 
         try:
             import openpyxl  # noqa: F401
 
-            self.openpyxl_available = True
+            cls.openpyxl_available = True
         except ImportError:
-            self.openpyxl_available = False
+            cls.openpyxl_available = False
 
         try:
             import odf.opendocument  # noqa: F401
 
-            self.odf_available = True
+            cls.odf_available = True
         except ImportError:
-            self.odf_available = False
+            cls.odf_available = False
 
     def test_rtf_header_alignment_left(self):
         """Test RTF export with left-aligned headers."""
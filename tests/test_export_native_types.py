@@ -13,21 +13,22 @@ from craftable.styles import XlsxStyle, OdsStyle
 class TestExportNativeTypes(unittest.TestCase):
     """Test that spreadsheet formats store native types appropriately."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Check for optional dependencies."""
         try:
             import openpyxl  # noqa: F401
 
-            self.openpyxl_available = True
+            cls.openpyxl_available = True
         except ImportError:
-            self.openpyxl_available = False
+            cls.openpyxl_available = False
 
         try:
             import odf.opendocument  # noqa: F401
 
-            self.odf_available = True
+            cls.odf_available = True
         except ImportError:
-            self.odf_available = False
+            cls.odf_available = False
 
     def test_xlsx_integer_storage(self):
         """Test XLSX stores integers as native numbers."""
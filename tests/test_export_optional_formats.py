@@ -12,34 +12,36 @@ from craftable.styles import DocxStyle, XlsxStyle, OdtStyle, OdsStyle, RtfStyle
 class TestExportOptionalFormats(unittest.TestCase):
     """Test optional export formats with backward compatibility."""
 
-    ROWS = [["Alice", 30, 95000], ["Bob", 25, 75000]]
-    HEADERS = ["Name", "Age", "Salary"]
+    ROWS = (("Alice", 30, 95000), ("Bob", 25, 75000))
+    HEADERS = ("Name", "Age", "Salary")
 
-    def setUp(self):
-        """Set up temporary directory and check for optional dependencies."""
-        self.tmp_dir = tempfile.mkdtemp()
-
-        # Check optional dependencies
+    @classmethod
+    def setUpClass(cls):
+        """Check for optional dependencies."""
         try:
             import docx  # noqa: F401
 
-            self.docx_available = True
+            cls.docx_available = True
         except ImportError:
-            self.docx_available = False
+            cls.docx_available = False
 
         try:
             import openpyxl  # noqa: F401
 
-            self.openpyxl_available = True
+            cls.openpyxl_available = True
         except ImportError:
-            self.openpyxl_available = False
+            cls.openpyxl_available = False
 
         try:
             import odf.opendocument  # noqa: F401
 
-            self.odf_available = True
+            cls.odf_available = True
         except ImportError:
-            self.odf_available = False
+            cls.odf_available = False
+
+    def setUp(self):
+        """Set up temporary directory."""
+        self.tmp_dir = tempfile.mkdtemp()
 
     def test_rtf_basic(self):
         """Test basic RTF export to file."""
@@ -2,33 +2,38 @@
 
 import unittest
 from craftable import get_table, ColDef, ColDefList
-from craftable.styles.basic_screen_style import BasicScreenStyle
-from craftable.styles.rounded_border_screen_style import RoundedBorderScreenStyle
-from craftable.styles.markdown_style import MarkdownStyle
-from craftable.styles.ascii_style import ASCIIStyle
-from craftable.styles.no_border_screen_style import NoBorderScreenStyle
+
+from . import utils as U
 
 
 class TestGetTable(unittest.TestCase):
     """Basic get_table rendering and options."""
 
+    # Shared, immutable inputs. get_table copies rows into fresh lists, so
+    # tuples can be passed straight through without defensive copies.
+    ALICE_BOB = (("Alice", 30), ("Bob", 25))
+    ALICE_BOB_CHARLIE = (("Alice", 30), ("Bob", 25), ("Charlie", 35))
+    NAME_AGE = ("Name", "Age")
+    LONG_TEXT = (("This is a very long piece of text that should wrap", "Short"),)
+    TRUNCATABLE = (("VeryLongTextThatShouldBeTruncated", "Short"),)
+
     def test_empty_table_shows_no_data_message(self):
-        result = get_table([])
-        self.assertIn("No data to display", result)
+        self.assertIn("No data to display", U.render(()))
 
     def test_simple_table_no_header(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data)
-        self.assertIn("Alice", result)
-        self.assertIn("Bob", result)
+        result = U.render(self.ALICE_BOB)
+        U.assert_contains_all(result, ("Alice", "Bob", "30", "25"))
 
     def test_simple_table_with_header(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        header = ["Name", "Age"]
-        result = get_table(data, header_row=header)
-        self.assertIn("Name", result)
-        self.assertIn("Age", result)
-        self.assertIn("Alice", result)
+        result = U.render(self.ALICE_BOB, header_row=self.NAME_AGE)
+        U.assert_in_order(result, "Name", "Age", "Alice", "30", "Bob", "25")
+
+    def test_does_not_mutate_caller_rows(self):
+        data = [["A", None], ["C", "D"]]
+        header = ["Col1", "Col2"]
+        get_table(data, header_row=header)
+        self.assertEqual(data, [["A", None], ["C", "D"]])
+        self.assertEqual(header, ["Col1", "Col2"])
 
     def test_single_row_table(self):
         data = [["Single", "Row", "Data"]]
@@ -43,8 +48,7 @@ class TestGetTable(unittest.TestCase):
     def test_mixed_data_types(self):
         data = [["Alice", 30, 5.5, True], ["Bob", 25, 6.2, False]]
         result = get_table(data)
-        self.assertIn("5.5", result)
-        self.assertIn("True", result)
+        U.assert_contains_all(result, ("Alice", "30", "5.5", "True", "False"))
 
     def test_none_values(self):
         data = [["Alice", None], [None, 25]]
@@ -59,97 +63,98 @@ class TestGetTable(unittest.TestCase):
         self.assertIn("Line2", result)
 
     def test_table_with_col_defs_string(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, col_defs=["<20", ">10"])
+        result = get_table(self.ALICE_BOB, col_defs=["<20", ">10"])
         self.assertIn("Alice", result)
 
+    def test_table_with_col_defs_alignment(self):
+        expected = {"<": "Alice     ", ">": "     Alice", "^": "  Alice   "}
+        for align, cell in expected.items():
+            with self.subTest(align=align):
+                result = U.render(self.ALICE_BOB, col_defs=(f"{align}10", "5"))
+                self.assertIn(cell, result)
+
     def test_table_with_col_defs_objects(self):
-        data = [["Alice", 30], ["Bob", 25]]
         col_defs = [ColDef(width=15, align="<"), ColDef(width=10, align=">")]
-        result = get_table(data, col_defs=col_defs)
+        result = get_table(self.ALICE_BOB, col_defs=col_defs)
         self.assertIn("Alice", result)
 
     def test_table_with_col_def_list(self):
-        data = [["Alice", 30], ["Bob", 25]]
         col_defs = ColDefList(["<15", ">10"])
-        result = get_table(data, col_defs=col_defs)
+        result = get_table(self.ALICE_BOB, col_defs=col_defs)
         self.assertIn("Bob", result)
 
     def test_table_with_header_defs(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        header = ["Name", "Age"]
-        result = get_table(data, header_row=header, header_defs=[">20", "^10"])
+        result = get_table(
+            self.ALICE_BOB, header_row=self.NAME_AGE, header_defs=[">20", "^10"]
+        )
         self.assertIn("Name", result)
 
     def test_table_with_basic_screen_style(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, style=BasicScreenStyle())
-        self.assertTrue(any(c in result for c in ["│", "─", "┌", "└", "╭", "╰"]))
+        result = U.render(self.ALICE_BOB, "basic")
+        self.assertFalse(U.BOX_CHARS.isdisjoint(result))
 
     def test_table_with_rounded_border_style(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, style=RoundedBorderScreenStyle())
+        result = U.render(self.ALICE_BOB, "rounded")
         self.assertIn("Alice", result)
 
     def test_table_with_markdown_style(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        header = ["Name", "Age"]
-        result = get_table(data, header_row=header, style=MarkdownStyle())
+        result = U.render(self.ALICE_BOB, "markdown", header_row=self.NAME_AGE)
         self.assertIn("|", result)
 
     def test_table_with_ascii_style(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        header = ["Name", "Age"]
-        result = get_table(data, header_row=header, style=ASCIIStyle())
+        result = U.render(self.ALICE_BOB, "ascii", header_row=self.NAME_AGE)
         self.assertIn("Alice", result)
+        self.assertLessEqual(U.ASCII_BORDER_CHARS, set(result))
+        self.assertTrue(U.BOX_CHARS.isdisjoint(result))
 
     def test_table_with_no_border_style(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, style=NoBorderScreenStyle())
+        result = U.render(self.ALICE_BOB, "no_border")
         self.assertIn("Bob", result)
 
     def test_table_with_fixed_width(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, table_width=50)
+        result = U.render(self.ALICE_BOB, table_width=50)
         self.assertIn("Alice", result)
 
     def test_table_with_lazy_end_true(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, lazy_end=True, style=BasicScreenStyle())
-        self.assertTrue(
-            all(line == line.rstrip() for line in result.split("\n") if line)
-        )
+        result = U.render(self.ALICE_BOB, "basic", lazy_end=True)
+        self.assertIsNone(U.TRAILING_WS_RE.search(result))
 
     def test_table_with_lazy_end_false(self):
-        data = [["Alice", 30], ["Bob", 25]]
-        result = get_table(data, lazy_end=False, style=BasicScreenStyle())
+        result = U.render(self.ALICE_BOB, "basic", lazy_end=False)
         self.assertIn("│", result)
 
     def test_table_with_separate_rows_true(self):
-        data = [["Alice", 30], ["Bob", 25], ["Charlie", 35]]
-        result = get_table(data, separate_rows=True, style=BasicScreenStyle())
-        self.assertGreater(len(result.split("\n")), 3)
+        result = U.render(self.ALICE_BOB_CHARLIE, "basic", separate_rows=True)
+        # top border + 3 rows + 2 separators + bottom border
+        self.assertEqual(len(result.splitlines()), 7)
 
     def test_table_with_long_text_wrapping(self):
-        long_text = "This is a very long piece of text that should wrap"
-        result = get_table([[long_text, "Short"]], table_width=40)
-        self.assertGreater(len(result.split("\n")), 1)
+        result = U.render(self.LONG_TEXT, table_width=40)
+        self.assertEqual(len(result.splitlines()), 2)
 
     def test_table_with_truncation(self):
-        data = [["VeryLongTextThatShouldBeTruncated", "Short"]]
-        result = get_table(data, col_defs=["<10T", "<10"])
-        self.assertIn("…", result)
+        for align in ("<", ">", "^"):
+            with self.subTest(align=align):
+                result = U.render(self.TRUNCATABLE, col_defs=(f"{align}10T", "<10"))
+                # the ellipsis sits exactly on the 10 character column boundary
+                match = U.TRUNCATED_CELL_RE.search(result)
+                self.assertIsNotNone(match)
+                self.assertEqual(match.group(), "VeryLongT…")
 
     def test_table_with_auto_fill_column(self):
         data = [["Short", "Text"], ["X", "Y"]]
         result = get_table(data, col_defs=["<5A", "<5"], table_width=50)
-        self.assertTrue(any(len(line) >= 40 for line in result.split("\n")))
+        self.assertGreaterEqual(U.max_line_len(result), 40)
 
     def test_table_with_numeric_formatting(self):
         data = [[123.456, 789.012], [0.123, 999.999]]
         result = get_table(data, col_defs=[".2f", ".1f"])
         self.assertIn("123.46", result)
 
+    def test_first_row_without_header_is_sized_formatted(self):
+        # with no header row, the first data row is a value row like any other
+        self.assertEqual(get_table([[1.5]], col_defs=[".3f"]), " 1.500 ")
+
     def test_table_with_percentage_formatting(self):
         data = [[0.123, 0.456], [0.789, 0.012]]
         result = get_table(data, col_defs=[".1%", ".0%"])
@@ -1,8 +1,10 @@
 """Edge case tests for get_table with unusual data shapes and characters."""
 
 import unittest
-from craftable import get_table
-from craftable.styles import BasicScreenStyle, RoundedBorderScreenStyle, MarkdownStyle
+from craftable import get_table, get_table_header
+from craftable.styles import BasicScreenStyle, MarkdownStyle
+
+from . import utils as U
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -19,8 +21,17 @@ class TestEdgeCases(unittest.TestCase):
         self.assertIn("Row99", result)
 
     def test_table_with_tabs_in_values(self):
-        result = get_table([["Value\twith\ttabs", "Normal"]])
-        self.assertIsNotNone(result)
+        result = get_table([["Value\twith\ttabs", "Normal"], ["x", "y"]])
+        self.assertNotIn("\t", result)
+        self.assertIn("Value   with    tabs", result)
+        self.assertEqual(len({len(line) for line in result.splitlines()}), 1)
+
+    def test_table_with_tabs_in_header(self):
+        # headers are sized on the same expanded text format_text renders
+        result = get_table([["a", "b"]], header_row=["x\ty", "z"])
+        self.assertEqual(result.splitlines()[0], " x       y │ z ")
+        header = get_table_header(["x\ty", "z"])
+        self.assertEqual(header.splitlines()[0], " x       y │ z")
 
     def test_table_with_carriage_returns(self):
         result = get_table([["Value\rwith\rCR", "Normal"]])
@@ -29,13 +40,18 @@ class TestEdgeCases(unittest.TestCase):
     def test_jagged_rows_various_lengths(self):
         data = [["A", "B"], ["C", "D", "E"], ["F"], ["G", "H", "I", "J"]]
         out = get_table(data)
-        self.assertIn("A", out)
+        lines = out.splitlines()
+        # short rows are padded with empty cells out to the widest row
+        self.assertEqual(lines[2], " F │   │   │   ")
+        self.assertEqual(len(set(map(len, lines))), 1)
 
     def test_header_row_mismatch(self):
         data = [["A", "B"], ["C", "D"]]
         header = ["Col1", "Col2", "Col3"]
         out = get_table(data, header_row=header)
-        self.assertIn("Col1", out)
+        lines = out.splitlines()
+        self.assertIn("Col3", lines[0])
+        self.assertEqual(lines[2], " A    │ B    │      ")
 
     def test_col_defs_mismatch(self):
         data = [["A", "B", "C"], ["D", "E", "F"]]
@@ -50,32 +66,25 @@ class TestEdgeCases(unittest.TestCase):
     def test_zero_width_columns_auto_size(self):
         data = [["A", "B"], ["C", "D"]]
         out = get_table(data, col_defs=["<0", "<0"])  # width 0 means auto-size
-        self.assertIn("A", out)
-        self.assertIn("D", out)
+        U.assert_contains_all(out, ("A", "D"))
 
     def test_very_wide_columns(self):
         data = [["A", "B"], ["C", "D"]]
         out = get_table(data, col_defs=["<100", "<100"])
-        self.assertTrue(any(len(line) > 100 for line in out.split("\n")))
+        self.assertGreater(U.max_line_len(out), 100)
 
     def test_table_with_special_characters(self):
         data = [["Hello 世界", "Café"], ["Über", "Naïve"]]
         result = get_table(data)
-        self.assertIn("世界", result)
-        self.assertIn("Café", result)
+        U.assert_contains_all(result, ("世界", "Café", "Über", "Naïve"))
 
     def test_table_preserves_row_order(self):
         data = [["First"], ["Second"], ["Third"]]
         result = get_table(data)
-        first_idx = result.find("First")
-        second_idx = result.find("Second")
-        third_idx = result.find("Third")
-        self.assertLess(first_idx, second_idx)
-        self.assertLess(second_idx, third_idx)
+        U.assert_in_order(result, "First", "Second", "Third")
 
     def test_table_with_header_and_no_data(self):
-        header = ["Col1", "Col2"]
-        result = get_table([], header_row=header)
+        result = U.render((), header_row=("Col1", "Col2"))
         self.assertIn("No data to display", result)
 
     def test_table_multiple_rows_same_values(self):
@@ -86,15 +95,13 @@ class TestEdgeCases(unittest.TestCase):
     def test_table_with_negative_numbers(self):
         data = [[-10, -20.5], [30, -40.123]]
         result = get_table(data)
-        self.assertIn("-10", result)
-        self.assertIn("-20.5", result)
+        U.assert_contains_all(result, ("-10", "-20.5", "-40.123"))
 
     def test_table_with_empty_string_col_defs(self):
         data = [["Short", "Medium text", "X"], ["A", "B", "C"]]
         col_defs = ["", "^", ">"]
         result = get_table(data, col_defs=col_defs)
-        self.assertIn("Short", result)
-        self.assertIn("Medium text", result)
+        U.assert_contains_all(result, ("Short", "Medium text"))
 
     def test_table_with_mixed_col_def_formats(self):
         data = [["abc", "123", "123 123 123"], ["abc", "123 123", "123 123 123 123"]]
@@ -102,10 +109,26 @@ class TestEdgeCases(unittest.TestCase):
         result = get_table(data, col_defs=col_defs, style=BasicScreenStyle())
         self.assertIn("abc", result)
 
-    def test_table_with_embedded_newlines_and_style(self):
-        data = [["Line", "Text with\nnewlines\nin it"]]
-        result = get_table(data, style=RoundedBorderScreenStyle())
-        self.assertIn("Text with", result)
+    def test_table_with_embedded_newlines(self):
+        data = (("Line", "Text with\nnewlines\nin it"),)
+        cases = (
+            {},
+            {"table_width": 50},
+            {"style": "rounded"},
+            {"style": "rounded", "separate_rows": True, "header_row": ("A", "B")},
+        )
+        for kwargs in cases:
+            with self.subTest(**kwargs):
+                lines = U.render(data, **kwargs).splitlines()
+                # each embedded line lands on its own rendered line, in order
+                line_idxs = [
+                    idx
+                    for needle in ("Text with", "newlines", "in it")
+                    for idx, line in enumerate(lines)
+                    if needle in line
+                ]
+                self.assertEqual(len(line_idxs), 3)
+                self.assertEqual(line_idxs, sorted(set(line_idxs)))
 
     def test_table_markdown_with_col_and_header_defs(self):
         data = [["A", "B", "C"], ["D", "E", "F"]]
@@ -119,16 +142,14 @@ class TestEdgeCases(unittest.TestCase):
             col_defs=col_defs,
             header_defs=header_defs,
         )
-        self.assertIn("|", result)
-        self.assertIn("Col1", result)
+        U.assert_contains_all(result, ("|", "Col1"))
 
     def test_table_with_long_text_varying_lengths(self):
-        data = [
-            ["abc", "123", "123 123 123"],
-            ["abc", "123 123", "123 123 123 123"],
-            ["abc", "123", "123 123 123 123 123"],
-            ["abc", "123 123", "123 123"],
-        ]
-        result = get_table(data)
-        self.assertIn("abc", result)
-        self.assertIn("123 123 123 123 123", result)
+        data = (
+            ("abc", "123", "123 123 123"),
+            ("abc", "123 123", "123 123 123 123"),
+            ("abc", "123", "123 123 123 123 123"),
+            ("abc", "123 123", "123 123"),
+        )
+        result = U.render(data)
+        U.assert_contains_all(result, ("abc", "123 123 123 123 123"))
@@ -4,6 +4,8 @@ import unittest
 from craftable import get_table_row
 from craftable.styles import BasicScreenStyle
 
+from . import utils as U
+
 
 class TestGetTableRow(unittest.TestCase):
     """Row-level rendering tests for get_table_row()."""
@@ -12,6 +14,11 @@ class TestGetTableRow(unittest.TestCase):
         out = get_table_row(["Alice", 30, "Engineer"])
         self.assertIn("Engineer", out)
 
+    def test_tuple_row_with_and_without_col_defs(self):
+        # col_defs or not, the row takes the same path through normalization
+        self.assertEqual(get_table_row(("a", "b")), " a │ b")
+        self.assertEqual(get_table_row(("a", "b"), col_defs=["", ""]), " a │ b")
+
     def test_row_with_numeric_formatting(self):
         out = get_table_row([123.456, 789.012], col_defs=[".2f", ".1f"])
         self.assertIn("123.46", out)
@@ -26,8 +33,7 @@ class TestGetTableRow(unittest.TestCase):
 
     def test_row_multiline_value(self):
         out = get_table_row(["Line1\nLine2", "Normal"])
-        self.assertIn("Line1", out)
-        self.assertIn("Line2", out)
+        U.assert_contains_all(out, ("Line1", "Line2", "Normal"))
 
     def test_row_with_none_value(self):
         out = get_table_row([None, "Value"])
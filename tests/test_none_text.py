@@ -23,12 +23,16 @@ class TestNoneTextPrecedence(unittest.TestCase):
         self.assertIn("N/A", result)
         self.assertIn("MISSING", result)
         self.assertIn("(empty)", result)
-        lines = result.split("\n")
+        lines = result.splitlines()
         data_line = [line for line in lines if "N/A" in line or "MISSING" in line][0]
         self.assertIn("N/A", data_line)
         self.assertIn("MISSING", data_line)
         self.assertIn("(empty)", data_line)
 
+    def test_global_none_text_reaches_undefined_columns(self):
+        result = get_table([["a", None]], col_defs=["<5"], none_text="-")
+        self.assertEqual(result, " a     │ - ")
+
     def test_coldef_none_text_overrides_global_in_get_table_row(self):
         row = [None, None, None]
         col_defs = ColDefList.parse(["10", "10", "10"])
@@ -71,6 +71,19 @@ class TestPrePostProcessors(unittest.TestCase):
             re.search(r"\[[^\]]*1\.23[^\]]*\]", table) or "[    1.23]" in table
         )
 
+    def test_preprocessor_reaches_column_without_col_def(self):
+        def pre_upper(val, row, idx):
+            return val.upper()
+
+        table = get_table(
+            [["a", "b"]],
+            col_defs=["<5"],
+            style=NoBorderScreenStyle(),
+            table_width=60,
+            preprocessors=[None, pre_upper],
+        )
+        self.assertIn("B", table)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
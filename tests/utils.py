@@ -0,0 +1,64 @@
+"""Shared fixtures and assertion helpers for the craftable test suite."""
+
+from typing import Iterable
+from functools import cache
+import re
+
+from craftable import get_table
+from craftable.styles import (
+    ASCIIStyle,
+    BasicScreenStyle,
+    MarkdownStyle,
+    NoBorderScreenStyle,
+    RoundedBorderScreenStyle,
+)
+
+STYLES = {
+    "basic": BasicScreenStyle,
+    "rounded": RoundedBorderScreenStyle,
+    "markdown": MarkdownStyle,
+    "ascii": ASCIIStyle,
+    "no_border": NoBorderScreenStyle,
+}
+
+# Characters that only appear when a box-drawing border has been rendered
+BOX_CHARS = frozenset("│─┌└╭╰")
+ASCII_BORDER_CHARS = frozenset("|+-")
+
+# A truncated cell: the run of non-space characters ending in an ellipsis
+TRUNCATED_CELL_RE = re.compile(r"\S*…")
+
+# Trailing spaces at the end of any line (what lazy_end must never leave)
+TRAILING_WS_RE = re.compile(r" +(\n|\Z)")
+
+
+@cache
+def render(rows: tuple, style: str = "no_border", **kwargs) -> str:
+    """
+    Render hashable rows once per unique argument set and reuse the text.
+
+    The cache lives for the whole test session, so identical tables built
+    by different test modules (e.g. the "No data to display" output) are
+    only rendered once.
+    """
+    return get_table(rows, style=STYLES[style](), **kwargs)
+
+
+def assert_contains_all(text: str, needles: Iterable[str]) -> None:
+    """Assert every needle appears in text, reporting all missing at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing from output: {missing!r}"
+
+
+def assert_in_order(text: str, *needles: str) -> None:
+    """Assert needles appear in text in the given order, in a single scan."""
+    pos = 0
+    for needle in needles:
+        idx = text.find(needle, pos)
+        assert idx != -1, f"{needle!r} not found after offset {pos}"
+        pos = idx + len(needle)
+
+
+def max_line_len(text: str) -> int:
+    """Return the length of the longest line in text (0 for empty text)."""
+    return max(map(len, text.splitlines()), default=0)